@@ -6,7 +6,7 @@ Fetches transcripts from your subscribed podcast YouTube channels.
 Run this on your local machine, then share the output with Claude.
 
 Setup:
-    pip install youtube-transcript-api google-api-python-client
+    pip install youtube-transcript-api aiohttp
 
 Usage:
     python fetch_podcasts.py                    # Fetch last 7 days
@@ -19,10 +19,14 @@ Requirements:
 """
 
 import argparse
+import asyncio
 import json
 import os
+import random
 import re
+import sqlite3
 import sys
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -35,12 +39,41 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from googleapiclient.discovery import build
+    import aiohttp
 except ImportError:
-    print("ERROR: google-api-python-client not installed")
-    print("Run: pip install google-api-python-client")
+    print("ERROR: aiohttp not installed")
+    print("Run: pip install aiohttp")
     sys.exit(1)
 
+# orjson serializes large transcripts several times faster than stdlib json,
+# but everything works without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# tqdm gives a live progress bar over transcript fetches; optional
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# zstd shrinks cached transcripts 3-4x (they're plain English text); optional
+try:
+    import zstandard as zstd
+    _COMPRESSOR = zstd.ZstdCompressor(level=3)
+    _DECOMPRESSOR = zstd.ZstdDecompressor()
+except ImportError:
+    zstd = None
+
+
+def dump_json(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
 
 # =============================================================================
 # CONFIGURATION - Your podcast channels
@@ -73,10 +106,126 @@ CHANNELS = [
 ]
 
 
+# =============================================================================
+# CHANNEL ID CACHE
+# =============================================================================
+
+# Handle -> channel ID mappings essentially never change, but resolving one
+# costs a search.list call (100 quota units). Cache them on disk between runs.
+CHANNEL_ID_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "podcast-digest", "channel_ids.json"
+)
+CHANNEL_ID_CACHE_MAX_AGE_DAYS = 90
+
+
+def load_channel_id_cache() -> dict:
+    """Load the handle -> channel ID cache, dropping stale entries."""
+    try:
+        with open(CHANNEL_ID_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    cutoff = datetime.now() - timedelta(days=CHANNEL_ID_CACHE_MAX_AGE_DAYS)
+    fresh = {}
+    for handle, entry in cache.items():
+        try:
+            resolved_at = datetime.fromisoformat(entry["resolved_at"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if resolved_at >= cutoff:
+            fresh[handle] = entry
+
+    return fresh
+
+
+def save_channel_id_cache(cache: dict) -> None:
+    """Write the handle -> channel ID cache back to disk."""
+    try:
+        os.makedirs(os.path.dirname(CHANNEL_ID_CACHE_FILE), exist_ok=True)
+        with open(CHANNEL_ID_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"  ⚠ Could not save channel ID cache: {e}")
+
+
+# =============================================================================
+# TRANSCRIPT CACHE
+# =============================================================================
+
+# On daily runs with --days 7, most returned videos were already fetched the
+# day before. Cache transcripts (including "no transcript available") in
+# SQLite so repeat runs skip the dominant network cost.
+TRANSCRIPT_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "podcast-digest", "transcripts.db"
+)
+
+
+def open_transcript_cache() -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the persistent transcript cache."""
+    try:
+        os.makedirs(os.path.dirname(TRANSCRIPT_CACHE_FILE), exist_ok=True)
+        conn = sqlite3.connect(TRANSCRIPT_CACHE_FILE)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT PRIMARY KEY,
+                fetched_at TEXT,
+                transcript TEXT,
+                has_transcript INTEGER
+            )
+        """)
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        print(f"  ⚠ Could not open transcript cache: {e}")
+        return None
+
+
+def cache_lookup_transcript(conn: sqlite3.Connection, video_id: str) -> Optional[tuple]:
+    """Return (transcript,) if the video is cached (transcript may be None)."""
+    row = conn.execute(
+        "SELECT transcript FROM transcripts WHERE video_id = ?", (video_id,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    transcript = row[0]
+    if isinstance(transcript, bytes):
+        # Rows written with zstd compression enabled
+        if zstd is None:
+            return None  # can't read compressed rows; treat as a miss
+        transcript = _DECOMPRESSOR.decompress(transcript).decode("utf-8")
+
+    return (transcript,)
+
+
+def cache_store_transcript(conn: sqlite3.Connection, video_id: str,
+                           transcript: Optional[str]) -> None:
+    """Record a fetched transcript (or its absence) in the cache."""
+    stored = transcript
+    if zstd is not None and transcript is not None:
+        stored = _COMPRESSOR.compress(transcript.encode("utf-8"))
+
+    conn.execute(
+        "INSERT OR REPLACE INTO transcripts (video_id, fetched_at, transcript, has_transcript) "
+        "VALUES (?, ?, ?, ?)",
+        (video_id, datetime.now().isoformat(), stored, int(transcript is not None))
+    )
+    conn.commit()
+
+
 # =============================================================================
 # YOUTUBE API FUNCTIONS
 # =============================================================================
 
+API_BASE = "https://www.googleapis.com/youtube/v3"
+
+# Concurrency caps - set from CLI flags in fetch_all_podcasts(). Bounding
+# in-flight requests avoids tripping YouTube's rate limits while still
+# overlapping network waits.
+API_SEMAPHORE: asyncio.Semaphore
+TRANSCRIPT_SEMAPHORE: asyncio.Semaphore
+
+
 def get_api_key() -> str:
     """Get YouTube API key from environment or prompt user."""
     api_key = os.environ.get("YOUTUBE_API_KEY")
@@ -108,17 +257,58 @@ Then either:
     return api_key
 
 
-def get_channel_id(youtube, handle: str) -> Optional[str]:
+def _is_retryable(e: Exception) -> bool:
+    """Whether an error is transient and worth retrying."""
+    if isinstance(e, aiohttp.ClientResponseError):
+        return e.status == 429 or e.status >= 500
+    if isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError,
+                      ConnectionError, TimeoutError)):
+        return True
+    # youtube-transcript-api raises YouTubeRequestFailed on 5xx responses
+    return "RequestFailed" in type(e).__name__
+
+
+async def with_retry(coro_factory, *, max_attempts: int = 5, base: float = 0.5):
+    """Run a coroutine, retrying transient failures with exponential backoff + jitter.
+
+    Retries 429/5xx responses, timeouts, and connection errors. Permanent
+    failures (404, quotaExceeded, ...) propagate immediately.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if not _is_retryable(e) or attempt == max_attempts - 1:
+                raise
+
+            # Honor Retry-After when the server tells us how long to wait
+            delay = base * 2**attempt + random.random() * 0.25
+            if isinstance(e, aiohttp.ClientResponseError) and e.headers:
+                retry_after = e.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = float(retry_after)
+
+            await asyncio.sleep(delay)
+
+
+async def api_get(session: aiohttp.ClientSession, api_key: str, endpoint: str, params: dict) -> dict:
+    """Issue a GET against a YouTube Data API endpoint and return parsed JSON."""
+    async with API_SEMAPHORE:
+        async with session.get(f"{API_BASE}/{endpoint}", params={**params, "key": api_key}) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def get_channel_id(session: aiohttp.ClientSession, api_key: str, handle: str) -> Optional[str]:
     """Convert a channel handle (@handle) to channel ID."""
     try:
         # Search for the channel by handle
-        request = youtube.search().list(
-            part="snippet",
-            q=f"@{handle}",
-            type="channel",
-            maxResults=1
-        )
-        response = request.execute()
+        response = await with_retry(lambda: api_get(session, api_key, "search", {
+            "part": "snippet",
+            "q": f"@{handle}",
+            "type": "channel",
+            "maxResults": 1,
+        }))
 
         if response.get("items"):
             return response["items"][0]["snippet"]["channelId"]
@@ -128,35 +318,51 @@ def get_channel_id(youtube, handle: str) -> Optional[str]:
         return None
 
 
-def get_uploads_playlist_id(youtube, channel_id: str) -> Optional[str]:
-    """Get the uploads playlist ID for a channel."""
-    try:
-        request = youtube.channels().list(
-            part="contentDetails",
-            id=channel_id
-        )
-        response = request.execute()
+def derive_uploads_playlist_id(channel_id: str) -> Optional[str]:
+    """Derive a channel's uploads playlist ID without an API call.
+
+    YouTube defines the uploads playlist as the channel ID with its "UC"
+    prefix swapped for "UU", so no channels.list lookup is needed.
+    """
+    if channel_id.startswith("UC"):
+        return "UU" + channel_id[2:]
+    return None
 
-        if response.get("items"):
-            return response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-        return None
-    except Exception as e:
-        print(f"  ⚠ Error getting uploads playlist: {e}")
-        return None
 
+async def get_uploads_playlist_ids(session: aiohttp.ClientSession, api_key: str,
+                                   channel_ids: list) -> dict:
+    """Map channel IDs to uploads playlist IDs, batching up to 50 per request."""
+    uploads = {}
 
-def get_recent_videos(youtube, playlist_id: str, days_back: int, max_results: int = 10) -> list:
+    for start in range(0, len(channel_ids), 50):
+        batch = channel_ids[start:start + 50]
+        try:
+            response = await with_retry(lambda: api_get(session, api_key, "channels", {
+                "part": "contentDetails",
+                "id": ",".join(batch),
+                "maxResults": 50,
+            }))
+
+            for item in response.get("items", []):
+                uploads[item["id"]] = item["contentDetails"]["relatedPlaylists"]["uploads"]
+        except Exception as e:
+            print(f"  ⚠ Error getting uploads playlists: {e}")
+
+    return uploads
+
+
+async def get_recent_videos(session: aiohttp.ClientSession, api_key: str, playlist_id: str,
+                            days_back: int, max_results: int = 10) -> list:
     """Get recent videos from a playlist (uploads)."""
     cutoff_date = datetime.now() - timedelta(days=days_back)
     videos = []
 
     try:
-        request = youtube.playlistItems().list(
-            part="snippet,contentDetails",
-            playlistId=playlist_id,
-            maxResults=min(max_results * 2, 50)  # Fetch extra to filter
-        )
-        response = request.execute()
+        response = await with_retry(lambda: api_get(session, api_key, "playlistItems", {
+            "part": "snippet,contentDetails",
+            "playlistId": playlist_id,
+            "maxResults": min(max_results * 2, 50),  # Fetch extra to filter
+        }))
 
         for item in response.get("items", []):
             snippet = item["snippet"]
@@ -172,14 +378,16 @@ def get_recent_videos(youtube, playlist_id: str, days_back: int, max_results: in
             except:
                 continue
 
-            # Filter by date
+            # Filter by date - the uploads playlist is ordered newest-first,
+            # so everything after the first too-old video is older still
             if pub_date < cutoff_date:
-                continue
+                break
 
             # Skip shorts (usually have #shorts in title or description)
-            if "#shorts" in title.lower() or "#shorts" in description.lower():
+            desc_lower = description.lower()
+            if "#shorts" in title.lower() or "#shorts" in desc_lower:
                 continue
-            if "/shorts/" in description:
+            if "/shorts/" in desc_lower:
                 continue
 
             # Skip very short titles (likely shorts)
@@ -208,101 +416,230 @@ def get_recent_videos(youtube, playlist_id: str, days_back: int, max_results: in
 # TRANSCRIPT FUNCTIONS
 # =============================================================================
 
-def get_transcript(video_id: str) -> Optional[str]:
-    """Fetch transcript for a video."""
+# Compiled once instead of on every transcript (each run cleans hundreds of
+# thousands of chars, so per-call re.compile overhead adds up)
+MUSIC_RE = re.compile(r'\[Music\]', re.IGNORECASE)
+APPLAUSE_RE = re.compile(r'\[Applause\]', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# One API client (and underlying HTTP session) per worker thread, rather than
+# a fresh instance per video
+_thread_local = threading.local()
+
+
+def _transcript_api() -> YouTubeTranscriptApi:
+    if not hasattr(_thread_local, "ytt_api"):
+        _thread_local.ytt_api = YouTubeTranscriptApi()
+    return _thread_local.ytt_api
+
+
+def _fetch_transcript_blocking(video_id: str) -> Optional[str]:
+    """Fetch transcript for a video (blocking; run via asyncio.to_thread)."""
     try:
-        ytt_api = YouTubeTranscriptApi()
-        transcript = ytt_api.fetch(video_id)
+        transcript = _transcript_api().fetch(video_id)
 
         # Combine all snippets into plain text
         text = " ".join([snippet.text for snippet in transcript.snippets])
 
         # Clean up common artifacts
-        text = re.sub(r'\[Music\]', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\[Applause\]', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = MUSIC_RE.sub('', text)
+        text = APPLAUSE_RE.sub('', text)
+        text = WHITESPACE_RE.sub(' ', text).strip()
 
         return text
 
     except Exception as e:
         error_name = type(e).__name__
+        # The API definitively reported absence - callers may cache this
         if "NoTranscript" in error_name or "TranscriptsDisabled" in error_name:
             return None
-        print(f"    ⚠ Transcript error: {error_name}")
-        return None
+        # Anything else is a fetch error, not absence; let it bubble up so
+        # with_retry can retry the transient ones and callers can tell the
+        # difference (RequestBlocked/IpBlocked land here too)
+        raise
+
+
+async def get_transcript(video_id: str) -> Optional[str]:
+    """Fetch transcript for a video without blocking the event loop.
+
+    Returns None only when the video definitively has no transcript;
+    fetch errors propagate so callers don't mistake them for absence.
+    """
+    async with TRANSCRIPT_SEMAPHORE:
+        return await with_retry(lambda: asyncio.to_thread(_fetch_transcript_blocking, video_id))
 
 
 # =============================================================================
 # MAIN PIPELINE
 # =============================================================================
 
-def fetch_all_podcasts(api_key: str, days_back: int = 7, max_per_channel: int = 5) -> list:
-    """Fetch recent videos and transcripts from all channels."""
+async def resolve_channel(session: aiohttp.ClientSession, api_key: str, channel: dict,
+                          cache: dict) -> Optional[tuple]:
+    """Resolve one channel entry to a (channel_name, channel_id) pair."""
+    name = channel["name"]
+    print(f"📺 {name}...")
 
-    youtube = build("youtube", "v3", developerKey=api_key)
-    all_episodes = []
+    if "channel_id" in channel:
+        return (name, channel["channel_id"])
 
-    print(f"\nFetching episodes from {len(CHANNELS)} channels (last {days_back} days)...\n")
+    handle = channel["handle"]
 
-    for channel in CHANNELS:
-        name = channel["name"]
-        print(f"📺 {name}...")
+    # Check the on-disk cache before spending a search.list call
+    if handle in cache:
+        return (name, cache[handle]["channel_id"])
 
-        # Get channel ID
-        if "channel_id" in channel:
-            channel_id = channel["channel_id"]
-        else:
-            channel_id = get_channel_id(youtube, channel["handle"])
+    channel_id = await get_channel_id(session, api_key, handle)
+    if not channel_id:
+        print(f"  ⚠ Could not find channel: {name}")
+        return None
 
-        if not channel_id:
-            print(f"  ⚠ Could not find channel")
-            continue
+    cache[handle] = {
+        "channel_id": channel_id,
+        "resolved_at": datetime.now().isoformat(),
+    }
+    return (name, channel_id)
 
-        # Get uploads playlist
-        playlist_id = get_uploads_playlist_id(youtube, channel_id)
-        if not playlist_id:
-            print(f"  ⚠ Could not find uploads playlist")
-            continue
 
-        # Get recent videos
-        videos = get_recent_videos(youtube, playlist_id, days_back, max_per_channel)
+async def process_channel(session: aiohttp.ClientSession, api_key: str, name: str,
+                          playlist_id: Optional[str], days_back: int, max_per_channel: int) -> list:
+    """Fetch one channel's recent videos as (channel_name, video) tuples."""
+    if not playlist_id:
+        print(f"  ⚠ Could not find uploads playlist: {name}")
+        return []
+
+    videos = await get_recent_videos(session, api_key, playlist_id, days_back, max_per_channel)
 
-        if not videos:
-            print(f"  (no new episodes)")
-            continue
+    if not videos:
+        print(f"  (no new episodes: {name})")
+
+    return [(name, video) for video in videos]
 
-        # Fetch transcripts
-        for video in videos:
-            print(f"  ✓ {video['title'][:50]}...")
 
-            transcript = get_transcript(video["video_id"])
+async def fetch_episode(channel_name: str, video: dict,
+                        cache_conn: Optional[sqlite3.Connection] = None,
+                        refresh: bool = False) -> dict:
+    """Fetch the transcript for one video and build its episode record."""
+    # Capture failures per-episode so one bad video can't sink the whole batch
+    try:
+        cached = None
+        if cache_conn is not None and not refresh:
+            cached = cache_lookup_transcript(cache_conn, video["video_id"])
+
+        if cached is not None:
+            transcript = cached[0]
+            print(f"  ✓ {video['title'][:50]}... (cached)")
+        else:
+            transcript = await get_transcript(video["video_id"])
 
             if transcript:
-                print(f"    ✓ Got transcript ({len(transcript):,} chars)")
-                all_episodes.append({
-                    "podcast": name,
-                    "title": video["title"],
-                    "video_id": video["video_id"],
-                    "url": video["url"],
-                    "published_at": video["published_at"],
-                    "description": video["description"],
-                    "transcript": transcript,
-                    "has_transcript": True
-                })
+                print(f"  ✓ {video['title'][:50]}... ({len(transcript):,} chars)")
             else:
-                print(f"    ⚠ No transcript available")
-                all_episodes.append({
-                    "podcast": name,
-                    "title": video["title"],
-                    "video_id": video["video_id"],
-                    "url": video["url"],
-                    "published_at": video["published_at"],
-                    "description": video["description"],
-                    "transcript": None,
-                    "has_transcript": False
-                })
+                print(f"  ⚠ No transcript: {video['title'][:50]}...")
+
+            # Only cache definitive outcomes (a transcript, or the API saying
+            # none exists) - fetch errors fall through to the except below
+            # without a store, so the next run retries them
+            if cache_conn:
+                cache_store_transcript(cache_conn, video["video_id"], transcript)
+    except Exception as e:
+        print(f"  ⚠ Error fetching episode {video['title'][:50]}...: {type(e).__name__} (will retry next run)")
+        transcript = None
+
+    return {
+        "podcast": channel_name,
+        "title": video["title"],
+        "video_id": video["video_id"],
+        "url": video["url"],
+        "published_at": video["published_at"],
+        "description": video["description"],
+        "transcript": transcript,
+        "has_transcript": transcript is not None
+    }
+
+
+async def fetch_all_podcasts(api_key: str, days_back: int = 7, max_per_channel: int = 5,
+                             concurrency: int = 16, transcript_concurrency: int = 8,
+                             on_episode=None, refresh: bool = False) -> list:
+    """Fetch recent videos and transcripts from all channels concurrently.
+
+    When on_episode is given, each episode is handed to it as soon as its
+    transcript arrives and only transcript-free metadata is kept in memory,
+    so peak RSS stays bounded to a single transcript.
+    """
+
+    global API_SEMAPHORE, TRANSCRIPT_SEMAPHORE
+    API_SEMAPHORE = asyncio.Semaphore(concurrency)
+    TRANSCRIPT_SEMAPHORE = asyncio.Semaphore(transcript_concurrency)
+
+    print(f"\nFetching episodes from {len(CHANNELS)} channels (last {days_back} days)...\n")
 
-    return all_episodes
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300)
+    channel_id_cache = load_channel_id_cache()
+    cached_before = len(channel_id_cache)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Resolve all channel IDs in parallel (cache hits skip the API entirely)
+        resolved = await asyncio.gather(*[
+            resolve_channel(session, api_key, channel, channel_id_cache)
+            for channel in CHANNELS
+        ])
+        resolved = [r for r in resolved if r]
+
+        if len(channel_id_cache) != cached_before:
+            save_channel_id_cache(channel_id_cache)
+
+        # Derive uploads playlists from channel IDs; only hit channels.list
+        # for the rare ID that doesn't follow the UC -> UU convention
+        uploads = {cid: derive_uploads_playlist_id(cid) for _, cid in resolved}
+        underivable = [cid for cid, playlist_id in uploads.items() if not playlist_id]
+        if underivable:
+            uploads.update(await get_uploads_playlist_ids(session, api_key, underivable))
+
+        # Fetch each channel's recent videos in parallel
+        per_channel = await asyncio.gather(*[
+            process_channel(session, api_key, name, uploads.get(cid), days_back, max_per_channel)
+            for name, cid in resolved
+        ])
+
+        all_videos = [pair for videos in per_channel for pair in videos]
+
+        if not all_videos:
+            return []
+
+        print(f"\nFetching transcripts for {len(all_videos)} videos...\n")
+
+        cache_conn = open_transcript_cache()
+        try:
+            tasks = [
+                fetch_episode(channel_name, video, cache_conn, refresh)
+                for channel_name, video in all_videos
+            ]
+
+            # Consume results as they finish rather than waiting on the whole
+            # batch, so downstream writes overlap with in-flight fetches and
+            # a Ctrl-C still leaves usable partial output
+            progress = None
+            if tqdm is not None:
+                progress = tqdm(total=len(tasks), unit="ep", desc="Transcripts")
+
+            episodes = []
+            try:
+                for coro in asyncio.as_completed(tasks):
+                    episode = await coro
+                    if on_episode is not None:
+                        on_episode(episode)
+                        episode = {k: v for k, v in episode.items() if k != "transcript"}
+                    episodes.append(episode)
+                    if progress is not None:
+                        progress.update(1)
+            finally:
+                if progress is not None:
+                    progress.close()
+
+            return episodes
+        finally:
+            if cache_conn is not None:
+                cache_conn.close()
 
 
 def main():
@@ -321,7 +658,15 @@ After running, share the JSON output with Claude to generate the magazine.
     )
     parser.add_argument("--days", type=int, default=7, help="Days to look back (default: 7)")
     parser.add_argument("--max-per-channel", type=int, default=5, help="Max videos per channel (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=16,
+                        help="Max concurrent YouTube API requests (default: 16)")
+    parser.add_argument("--transcript-concurrency", type=int, default=8,
+                        help="Max concurrent transcript fetches (default: 8)")
     parser.add_argument("-o", "--output", type=str, help="Output file (default: print to stdout)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-fetch transcripts even if they're in the local cache")
+    parser.add_argument("--jsonl", action="store_true",
+                        help="Stream episodes as JSON Lines while fetching (bounds memory use)")
     parser.add_argument("--quiet", action="store_true", help="Minimal output")
 
     args = parser.parse_args()
@@ -329,12 +674,35 @@ After running, share the JSON output with Claude to generate the magazine.
     # Get API key
     api_key = get_api_key()
 
+    # In JSONL mode, write each episode out the moment its transcript lands
+    # instead of buffering every transcript in memory
+    out_file = None
+    on_episode = None
+    if args.jsonl:
+        if args.output:
+            out_file = open(args.output, "w", encoding="utf-8")
+        else:
+            # Data goes to stdout, so reroute all progress prints to stderr -
+            # otherwise `--jsonl > out.jsonl` mixes log lines into the records
+            out_file = sys.stdout
+            sys.stdout = sys.stderr
+        def on_episode(episode):
+            out_file.write(dump_json(episode) + "\n")
+            out_file.flush()  # keep partial output usable if interrupted
+
     # Fetch episodes
-    episodes = fetch_all_podcasts(
+    episodes = asyncio.run(fetch_all_podcasts(
         api_key=api_key,
         days_back=args.days,
-        max_per_channel=args.max_per_channel
-    )
+        max_per_channel=args.max_per_channel,
+        concurrency=args.concurrency,
+        transcript_concurrency=args.transcript_concurrency,
+        on_episode=on_episode,
+        refresh=args.refresh
+    ))
+
+    if args.jsonl and args.output:
+        out_file.close()
 
     # Summary
     total = len(episodes)
@@ -348,17 +716,21 @@ After running, share the JSON output with Claude to generate the magazine.
     print(f"With transcripts: {with_transcript}")
     print(f"Podcasts covered: {podcasts}")
 
-    # Output
-    if args.output:
+    # Output (JSONL mode already streamed everything out above)
+    if args.jsonl:
+        if args.output:
+            print(f"\nSaved to: {args.output}")
+            print(f"\nNext step: Share {args.output} with Claude to generate the magazine!")
+    elif args.output:
         with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(episodes, f, indent=2, ensure_ascii=False)
+            f.write(dump_json(episodes, indent=True))
         print(f"\nSaved to: {args.output}")
         print(f"\nNext step: Share {args.output} with Claude to generate the magazine!")
     else:
         print(f"\n{'='*60}")
         print("JSON OUTPUT (copy everything below this line):")
         print("="*60 + "\n")
-        print(json.dumps(episodes, indent=2, ensure_ascii=False))
+        print(dump_json(episodes, indent=True))
 
 
 if __name__ == "__main__":
@@ -6,8 +6,27 @@ Breaks large JSON into smaller episode files that Claude can handle.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# orjson encodes the large transcript payloads much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_json(job):
+    """Write one (filepath, data) pair as indented JSON."""
+    filepath, data = job
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
 def prepare_chunks(input_file, output_dir):
     """Break podcasts.json into individual episode files."""
 
@@ -50,7 +69,9 @@ def prepare_chunks(input_file, output_dir):
         'quick_hits': []
     }
 
-    # Save individual full episodes
+    # Save individual full episodes (writes are queued up and flushed in
+    # parallel below - they're independent, so no need to serialize on disk)
+    write_jobs = []
     for idx, ep in enumerate(full_episodes, 1):
         # For very long transcripts, split into sections
         transcript = ep.get('transcript', '')
@@ -58,14 +79,16 @@ def prepare_chunks(input_file, output_dir):
 
         # If transcript is huge (>50K chars), create a condensed version
         if transcript_len > 50000:
-            # Take first 20K, middle 20K, and last 10K
-            condensed = (
-                transcript[:20000] +
-                "\n\n[...MIDDLE SECTION OMITTED...]\n\n" +
-                transcript[transcript_len//2 - 10000:transcript_len//2 + 10000] +
-                "\n\n[...SECTION OMITTED...]\n\n" +
+            # Take first 20K, middle 20K, and last 10K; a single join builds
+            # the result in one allocation instead of chaining concatenations
+            mid = transcript_len // 2
+            condensed = ''.join([
+                transcript[:20000],
+                "\n\n[...MIDDLE SECTION OMITTED...]\n\n",
+                transcript[mid - 10000:mid + 10000],
+                "\n\n[...SECTION OMITTED...]\n\n",
                 transcript[-10000:]
-            )
+            ])
             ep_data = {
                 **ep,
                 'transcript_original_length': transcript_len,
@@ -77,9 +100,7 @@ def prepare_chunks(input_file, output_dir):
 
         filename = f"episode_{idx:02d}_full.json"
         filepath = output_path / filename
-
-        with open(filepath, 'w') as f:
-            json.dump(ep_data, f, indent=2)
+        write_jobs.append((filepath, ep_data))
 
         metadata['full_episodes'].append({
             'file': filename,
@@ -91,9 +112,7 @@ def prepare_chunks(input_file, output_dir):
 
     # Save all quick hits in one file (they're small)
     if quick_hits:
-        quick_hits_file = output_path / "quick_hits_all.json"
-        with open(quick_hits_file, 'w') as f:
-            json.dump(quick_hits, f, indent=2)
+        write_jobs.append((output_path / "quick_hits_all.json", quick_hits))
 
         for ep in quick_hits:
             metadata['quick_hits'].append({
@@ -104,8 +123,11 @@ def prepare_chunks(input_file, output_dir):
             })
 
     # Save metadata
-    with open(output_path / "_metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
+    write_jobs.append((output_path / "_metadata.json", metadata))
+
+    # Flush all files concurrently - overlaps JSON encoding and write() calls
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_write_json, write_jobs))
 
     return metadata
 